@@ -1,5 +1,7 @@
 import os
+import re
 import json
+import asyncio
 from pathlib import Path
 
 import pandas as pd
@@ -11,9 +13,10 @@ from langchain_anthropic import ChatAnthropic
 
 from src.processing.process_data import generate_metrics_prompt_and_plots
 from src.processing.generate_final_prompt import generate_final_prompt
-from src.processing.generate_report_text import generate_final_report
-from src.processing.generate_pdf_file import build_pdf_report
+from src.processing.generate_report_text import stream_final_report
+from src.processing.generate_pdf_file import build_pdf_report_from_stream
 from src.news.fetch_news import fetch_news
+from src.news.embeddings import SentenceTransformerEmbeddings
 from src.news.vectorstore import generate_vector_store
 from src.news.similarity_search import perform_similarity_search
 
@@ -33,9 +36,22 @@ llm = ChatAnthropic(
 BASE_DIR = Path("data/interim")  
 EXP_DIR = Path("data/processed")
 IMAGES_DIR = Path("images")
+CACHE_DIR = Path("data/cache")
 
-# Reading main dataframe
-df_srag = pd.read_parquet(f"{BASE_DIR}/df_srag.parquet")
+# Reading main dataframe (only the columns used downstream are decoded)
+SRAG_COLUMNS = [
+    "DT_NOTIFIC", "NU_NOTIFIC", "EVOLUCAO", "UTI",
+    "VACINA", "VACINA_COV", "CLASSI_FIN"
+]
+SRAG_CODE_COLUMNS = ["EVOLUCAO", "UTI", "VACINA", "VACINA_COV", "CLASSI_FIN"]
+
+df_srag = pd.read_parquet(f"{BASE_DIR}/df_srag.parquet", columns=SRAG_COLUMNS)
+
+# Categorical codes fit in nullable int8 (1/8 of the float64 memory)
+df_srag = df_srag.astype({col: "Int8" for col in SRAG_CODE_COLUMNS})
+
+# Sorting once by date so every period window can be sliced via binary search
+df_srag = df_srag.sort_values("DT_NOTIFIC").reset_index(drop=True)
 last_available_date = df_srag["DT_NOTIFIC"].max()
 
 # Defining periods (days) for each rate calculation
@@ -50,6 +66,9 @@ vacc_rate_period = 30
 chart_daily_period = 30 #days
 chart_monthly_period = 12 #months
 
+# Maximum time (seconds) to wait for NewsAPI before moving on without news
+news_fetch_timeout = 15
+
 # Mensagem inicial enxuta
 welcome_message = f"""
 Olá! 👋
@@ -84,54 +103,100 @@ pdf_confirm_prompt = ChatPromptTemplate.from_messages([
 
 confirm_chain = pdf_confirm_prompt | llm | StrOutputParser()
 
-def confirm_execution(texto: str) -> dict:
-    raw = confirm_chain.invoke({"input": texto})
-    return json.loads(raw)
+# Short, unambiguous answers (made only of yes/no words and punctuation,
+# e.g. "sim", "ok, pode!") are recognized locally, skipping an LLM round-trip.
+# Anything else (e.g. "claro que não") falls back to the confirmation chain
+_YES_RE = re.compile(
+    r"^\W*(?:(?:s(?:im)?|y(?:es)?|ok|pode|claro|bora|vamos)\b\W*)+$", re.IGNORECASE
+)
+_NO_RE = re.compile(
+    r"^\W*(?:(?:n(?:ão|ao|o)?|negativo|cancela)\b\W*)+$", re.IGNORECASE
+)
 
-if __name__ == "__main__":
-    print(welcome_message)
-    user_entry = input()
-    decisao = confirm_execution(user_entry)
+async def confirm_execution(texto: str) -> dict:
+    if _YES_RE.match(texto):
+        return {"generate_pdf": True}
+    if _NO_RE.match(texto):
+        return {"generate_pdf": False}
+    raw = await confirm_chain.ainvoke({"input": texto})
+    return json.loads(raw)
 
-    if decisao["generate_pdf"]:
-        print("Calculando métricas e gerando gráficos. . .")
-        metrics_prompt = generate_metrics_prompt_and_plots(
+async def fetch_news_with_timeout():
+    """Fetch news in a worker thread, giving up after `news_fetch_timeout` seconds."""
+    try:
+        return await asyncio.wait_for(
+            asyncio.to_thread(fetch_news, news_api_key, CACHE_DIR),
+            timeout=news_fetch_timeout
+        )
+    except asyncio.TimeoutError:
+        print("Busca de notícias excedeu o tempo limite, seguindo sem notícias.")
+        return None
+
+async def prepare_report_inputs():
+    """
+    Run the metrics/charts computation, the news fetch and the embedding
+    model load concurrently, so total latency is roughly the slowest branch.
+    """
+    (metrics_prompt, chart_buffers), df_news, _ = await asyncio.gather(
+        asyncio.to_thread(
+            generate_metrics_prompt_and_plots,
             qty_of_cases_var_period_1, 
             qty_of_cases_var_period_2, 
             death_rate_period, 
             uti_occup_rate_period,
             vacc_rate_period,
             df_srag
-        )
-
-        print("Buscando noticias relacionadas a SRAG. . .")
-        df_news = fetch_news(news_api_key)
-
-        print("Criando embeddings e banco vetorial. . .")
-        vector_store = generate_vector_store(df_news)
+        ),
+        fetch_news_with_timeout(),
+        # Warms the model cache used later by generate_vector_store
+        asyncio.to_thread(SentenceTransformerEmbeddings)
+    )
+    return metrics_prompt, chart_buffers, df_news
+
+async def main():
+    print(welcome_message)
+    user_entry = input()
+    decisao = await confirm_execution(user_entry)
 
+    if decisao["generate_pdf"]:
         print(
-            "Realizando busca por similaridade, extraindo top 2 notícias relacionadas. . ."    
+            "Calculando métricas, gerando gráficos e buscando notícias "
+            "relacionadas a SRAG. . ."
         )
-        news_query = "SRAG aumento de casos/taxa de vacinação/taxa de mortalidade/taxa de internação em UTI/ Brasil"
+        metrics_prompt, chart_buffers, df_news = await prepare_report_inputs()
 
-        top_news_content_list = perform_similarity_search(
-            news_query, vector_store, k=2
-        )
+        top_news_content_list = []
+        if df_news is not None:
+            print("Criando embeddings e banco vetorial. . .")
+            vector_store = generate_vector_store(df_news, cache_dir=CACHE_DIR)
+
+            print(
+                "Realizando busca por similaridade, extraindo top 2 notícias relacionadas. . ."    
+            )
+            news_query = "SRAG aumento de casos/taxa de vacinação/taxa de mortalidade/taxa de internação em UTI/ Brasil"
+
+            top_news_content_list = perform_similarity_search(
+                news_query, vector_store, k=2
+            )
 
         print("Gerando prompt final. . .")
-        final_prompt = generate_final_prompt(
+        static_system_prompt, dynamic_user_prompt = generate_final_prompt(
             metrics_prompt, top_news_content_list, last_available_date, 
             chart_daily_period, chart_monthly_period
         )
 
-        print("Executando a chain final para criação do texto. . .")
-        final_text_report = generate_final_report(final_prompt, llm)
-
-        print("Gerando e salvando o .pdf. . .")
-        build_pdf_report(
-            EXP_DIR, IMAGES_DIR, final_text_report, 
-            title = "Relatório Técnico do Panorama de SRAG"
+        print(
+            "Executando a chain final para criação do texto e "
+            "gerando e salvando o .pdf. . ."
+        )
+        # Paragraphs are added to the PDF as the LLM streams them
+        await build_pdf_report_from_stream(
+            EXP_DIR, IMAGES_DIR,
+            stream_final_report(
+                static_system_prompt, dynamic_user_prompt, llm, cache_dir=CACHE_DIR
+            ),
+            title = "Relatório Técnico do Panorama de SRAG",
+            image_buffers = chart_buffers
         )
 
 
@@ -142,3 +207,6 @@ if __name__ == "__main__":
             "permitindo variar os períodos das métricas e da busca por notícias. "
             "Assim você terá ainda mais controle sobre os relatórios gerados!"
         )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,97 +1,209 @@
 # --- Standard Library ---
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # --- Third-Party Libraries ---
+import numpy as np
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-from matplotlib.dates import DateFormatter
+import matplotlib as mpl
+import matplotlib.style as mplstyle
+from matplotlib.axes import Axes
+from matplotlib.dates import AutoDateLocator, DateFormatter
+from matplotlib.figure import Figure
+
+# Headless backend: charts are only saved to files
+mpl.use("Agg")
+
+# Plot style, set once per process
+mplstyle.use("seaborn-v0_8-white")
+
+# Let Agg drop line vertices that don't change the rendered path
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+
+# Above these limits the daily plot is resampled weekly / ticks are auto-located
+# / markers are omitted
+MAX_DAILY_POINTS = 60
+MAX_DATE_TICKS = 30
+MAX_MARKER_POINTS = 30
 
 def generate_and_store_plots(
         df_daily_info: pd.DataFrame,
-        daily_period: int = 30, 
-        monthly_period: int = 12
-    ):
+        daily_period: int = 30,
+        monthly_period: int = 12,
+        dpi: int = 120,
+        single_figure: bool = False
+    ) -> list[io.BytesIO]:
     """
-    Generate two plots using seaborn/matplotlib:
+    Generate two plots using matplotlib:
         1. Daily number of cases for the last `daily_period` days (line plot with filled area)
         2. Monthly number of cases for the last `monthly_period` months (bar plot with last month highlighted)
-    
-    Optionally, save the plots as PNG files.
+
+    By default both figures are built independently and saved as PNG files in
+    parallel. With `single_figure=True`, both plots are drawn as subplots of
+    one figure and saved once, as a single PNG.
+
+    Each PNG is encoded once in memory: the same bytes are written to the
+    images folder and returned, so they can be embedded in the PDF report
+    without reading and decoding the files again.
 
     Args:
         df_daily_info (pd.DataFrame): DataFrame with daily case counts.
                            Must contain columns:
-                           - 'DT_NOTIFIC' (datetime)
+                           - 'DT_NOTIFIC' (datetime, sorted ascending)
                            - 'NU_CASOS' (int/float)
         daily_period (int): Number of days for daily trend plot.
         monthly_period (int): Number of months for monthly trend plot.
-        save_path (str, optional): Directory path to save plots. If None, plots are not saved.
+        dpi (int): Resolution of the stored PNGs. The 12x6 inch figures are
+                   scaled down to the ~17 cm (≈6.7 inch) text width of the A4
+                   PDF report, so 120 dpi is still sharp there. Defaults to 120.
+        single_figure (bool): Whether to store both plots in a single image.
+                              Defaults to False.
+
+    Returns:
+        list[io.BytesIO]: PNG buffers of the stored plots (rewound), in order.
     """
     # Setting the path to store images
-    EXP_IMG_DIR = Path("../../images")
+    EXP_IMG_DIR = Path(__file__).parent.parent.parent / "images"
 
     # Make sure the folder exists
     os.makedirs(EXP_IMG_DIR, exist_ok=True)
+    print(f"Saving plots to: {EXP_IMG_DIR.resolve()}")
+
+    # Ensure datetime type (without mutating the caller's DataFrame,
+    # which may be read concurrently by other threads)
+    if not pd.api.types.is_datetime64_any_dtype(df_daily_info["DT_NOTIFIC"]):
+        df_daily_info = df_daily_info.assign(
+            DT_NOTIFIC=pd.to_datetime(df_daily_info["DT_NOTIFIC"])
+        )
 
-    # Ensure datetime type
-    df_daily_info["DT_NOTIFIC"] = pd.to_datetime(df_daily_info["DT_NOTIFIC"])
+    if single_figure:
+        fig = Figure(figsize=(12, 12))
+        ax_daily, ax_monthly = fig.subplots(nrows=2)
+        plot_daily_cases(df_daily_info, daily_period, ax=ax_daily)
+        plot_monthly_cases(df_daily_info, monthly_period, ax=ax_monthly)
+        return [
+            save_figure(
+                fig,
+                EXP_IMG_DIR / f"cases_last_{daily_period}_days_{monthly_period}_months.png",
+                dpi=dpi
+            )
+        ]
 
-    # Set seaborn style
-    sns.set_theme(style="white")
+    figures_and_paths = [
+        (
+            plot_daily_cases(df_daily_info, daily_period),
+            EXP_IMG_DIR / f"daily_cases_last_{daily_period}_days.png"
+        ),
+        (
+            plot_monthly_cases(df_daily_info, monthly_period),
+            EXP_IMG_DIR / f"monthly_cases_last_{monthly_period}_months.png"
+        )
+    ]
 
-    last_date = df_daily_info["DT_NOTIFIC"].max()
+    # Storing images (rasterization of each figure runs on its own thread)
+    with ThreadPoolExecutor(max_workers=len(figures_and_paths)) as executor:
+        return list(executor.map(
+            lambda args: save_figure(*args, dpi=dpi), figures_and_paths
+        ))
+
+
+def plot_daily_cases(
+        df_daily_info: pd.DataFrame, daily_period: int = 30, ax: Axes = None
+    ) -> Figure:
+    """
+    Build the daily cases line plot (with filled area) for the last `daily_period` days.
+    Periods longer than `MAX_DAILY_POINTS` days are resampled to weekly totals.
+
+    Args:
+        df_daily_info (pd.DataFrame): DataFrame with 'DT_NOTIFIC' (sorted) and 'NU_CASOS'.
+        daily_period (int): Number of days to plot.
+        ax (Axes, optional): Axes to draw on. Defaults to None, which creates
+                             a new 12x6 inch figure.
+
+    Returns:
+        Figure: Matplotlib figure (not attached to pyplot's global state).
+    """
+    # Dates are sorted, so periods are sliced via binary search
+    dates = df_daily_info["DT_NOTIFIC"].to_numpy()
+    last_date = pd.Timestamp(dates[-1])
 
-    # -----------------------
-    # Daily plot with filled area
-    # -----------------------
     start_date = last_date - pd.Timedelta(days=daily_period-1)
-    df_last = df_daily_info[df_daily_info["DT_NOTIFIC"] >= start_date]
-
-    plt.figure(figsize=(12, 6))
-    ax = sns.lineplot(
-        data=df_last,
-        x="DT_NOTIFIC",
-        y="NU_CASOS",
-        marker="o",
+    df_last = df_daily_info.iloc[
+        np.searchsorted(dates, start_date.to_datetime64()):
+    ]
+
+    # Long periods are pre-aggregated weekly to keep the number of drawn points low
+    title_freq = "Daily"
+    if daily_period > MAX_DAILY_POINTS:
+        df_last = (
+            df_last.resample("W", on="DT_NOTIFIC")["NU_CASOS"]
+            .sum()
+            .reset_index()
+        )
+        title_freq = "Weekly"
+
+    if ax is None:
+        ax = Figure(figsize=(12, 6)).subplots()
+    fig = ax.figure
+    x = df_last["DT_NOTIFIC"].to_numpy()
+    y = df_last["NU_CASOS"].to_numpy()
+
+    # Markers are only drawn while points are few enough to be distinguishable
+    ax.plot(
+        x, y,
+        marker="o" if len(x) <= MAX_MARKER_POINTS else None,
         markersize=7,
         linewidth=2.5,
         color="royalblue"
     )
 
     # Fill under the curve
-    ax.fill_between(
-        df_last["DT_NOTIFIC"], df_last["NU_CASOS"], color="royalblue", alpha=0.2
-    )
+    ax.fill_between(x, y, color="royalblue", alpha=0.2)
 
-    # Format x-axis as DD/MM and show all dates
+    # Format x-axis as DD/MM, showing all dates only while they fit
+    if len(x) <= MAX_DATE_TICKS:
+        ax.set_xticks(x)
+    else:
+        ax.xaxis.set_major_locator(AutoDateLocator(maxticks=MAX_DATE_TICKS))
     ax.xaxis.set_major_formatter(DateFormatter("%d/%m"))
-    ax.set_xticks(df_last["DT_NOTIFIC"])
     ax.grid(axis='x', linestyle='--', alpha=0.5)  # vertical grid
-    plt.title(f"Daily SRAG Cases - Last {daily_period} Days", fontsize=14, weight="bold")
-    plt.xlabel("Date")
-    plt.ylabel("Number of Cases")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+    ax.set_title(
+        f"{title_freq} SRAG Cases - Last {daily_period} Days", fontsize=14, weight="bold"
+    )
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Number of Cases")
+    ax.tick_params(axis="x", rotation=45)
+    fig.tight_layout()
 
-    EXP_IMG_DIR = Path(__file__).parent.parent.parent / "images"
-    os.makedirs(EXP_IMG_DIR, exist_ok=True)
-    print(f"Saving plots to: {EXP_IMG_DIR.resolve()}")
+    return fig
 
 
-    # Storing images
-    plt.savefig(
-        EXP_IMG_DIR / f"daily_cases_last_{daily_period}_days.png", 
-        dpi=300
-    )
+def plot_monthly_cases(
+        df_daily_info: pd.DataFrame, monthly_period: int = 12, ax: Axes = None
+    ) -> Figure:
+    """
+    Build the monthly cases bar plot for the last `monthly_period` months,
+    highlighting the last month when it is partial.
+
+    Args:
+        df_daily_info (pd.DataFrame): DataFrame with 'DT_NOTIFIC' (sorted) and 'NU_CASOS'.
+        monthly_period (int): Number of months to plot.
+        ax (Axes, optional): Axes to draw on. Defaults to None, which creates
+                             a new 12x6 inch figure.
+
+    Returns:
+        Figure: Matplotlib figure (not attached to pyplot's global state).
+    """
+    dates = df_daily_info["DT_NOTIFIC"].to_numpy()
+    last_date = pd.Timestamp(dates[-1])
 
-    plt.close()
-    # -----------------------
-    # Monthly plot with last partial month highlighted
-    # -----------------------
     start_month = last_date - pd.DateOffset(months=monthly_period)
-    df_last_n_months = df_daily_info[df_daily_info["DT_NOTIFIC"] >= start_month]
+    df_last_n_months = df_daily_info.iloc[
+        np.searchsorted(dates, start_month.to_datetime64()):
+    ]
 
     # Aggregate by month-end using ME
     df_monthly = (
@@ -102,47 +214,55 @@ def generate_and_store_plots(
         .reset_index()
     )
 
-    # Format month as MM/YY
-    df_monthly["month_label"] = df_monthly["DT_NOTIFIC"].dt.strftime("%m/%y")
+    # Format month as MM/YY ("YYYY-MM" period strings rearranged in bulk)
+    months = df_monthly["DT_NOTIFIC"].dt.to_period("M")
+    df_monthly["month_label"] = months.astype(str).str.replace(
+        r"^\d{2}(\d{2})-(\d{2})$", r"\2/\1", regex=True
+    )
 
     # Check if last month is partial
-    is_last_partial = df_monthly["DT_NOTIFIC"].iloc[-1].month == last_date.month and \
-                      df_monthly["DT_NOTIFIC"].iloc[-1].year == last_date.year
+    is_last_partial = months.iloc[-1] == pd.Period(last_date, "M")
     if is_last_partial:
         df_monthly.loc[
             df_monthly.index[-1], "month_label"
         ] += f" (until {last_date.strftime('%d/%m')})"
-        
+
 
     # Prepare colors: all bars royalblue, last one orange if partial
     colors = ["royalblue"] * len(df_monthly)
     if is_last_partial:
         colors[-1] = "orange"
 
-    plt.figure(figsize=(12, 6))
-    bars = plt.bar(
+    if ax is None:
+        ax = Figure(figsize=(12, 6)).subplots()
+    fig = ax.figure
+    ax.bar(
         df_monthly["month_label"], df_monthly["NU_CASOS"], color=colors
     )
 
     # Highlight last x-axis label (negrito)
     if is_last_partial:
-        tick_labels = plt.gca().get_xticklabels()
+        tick_labels = ax.get_xticklabels()
         tick_labels[-1].set_fontweight("bold")
         tick_labels[-1].set_color("black")
 
-    plt.title(
-        f"Monthly SRAG Cases - Last {monthly_period} Months", 
+    ax.set_title(
+        f"Monthly SRAG Cases - Last {monthly_period} Months",
         fontsize=14, weight="bold"
     )
-    plt.xlabel("Month")
-    plt.ylabel("Number of Cases")
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-
-    # Storing images
-    plt.savefig(
-        EXP_IMG_DIR / f"monthly_cases_last_{monthly_period}_months.png", 
-        dpi=300
-    )
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Number of Cases")
+    ax.tick_params(axis="x", rotation=45)
+    fig.tight_layout()
+
+    return fig
+
+
+def save_figure(fig: Figure, path: Path, dpi: int = 120) -> io.BytesIO:
+    """Rasterize a figure as PNG in memory, store it in `path` and return the buffer."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    path.write_bytes(buffer.getvalue())
+    buffer.seek(0)
 
-    plt.close()
+    return buffer
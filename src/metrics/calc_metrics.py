@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def calc_case_var_rate_by_period(
@@ -28,26 +29,34 @@ def calc_case_var_rate_by_period(
 
     Notes:
         - Only the last 2 * period_days are considered to avoid unnecessary computation.
-        - Ensure that 'DT_NOTIFIC' is of datetime type.
+        - Ensure that 'DT_NOTIFIC' is of datetime type and sorted in ascending order.
         - This function assumes the DataFrame is not empty and contains sufficient data
           for the specified period.
     """
 
-    last_date = df_daily_info["DT_NOTIFIC"].max()
+    # Dates are sorted, so window bounds come from binary search
+    dates = df_daily_info["DT_NOTIFIC"].to_numpy()
+    last_date = pd.Timestamp(dates[-1])
 
     # Start of the window covering the previous and current period
     window_start_date = last_date - pd.Timedelta(days=period_days*2 - 1)
 
-    # Filter DataFrame to keep only relevant period
-    df_window = df_daily_info[df_daily_info["DT_NOTIFIC"] >= window_start_date].copy()
+    # Start of the current period (end of the previous one)
+    curr_start_date = window_start_date + pd.Timedelta(days=period_days)
+
+    start_idx, split_idx = np.searchsorted(
+        dates,
+        np.array([window_start_date, curr_start_date], dtype="datetime64[ns]")
+    )
+
+    # Only the cases column is read, sliced without copying
+    cases = df_daily_info["NU_CASOS"]
 
     # Previous period: first `period_days` in the window
-    df_prev_period = df_window[df_window["DT_NOTIFIC"] <= window_start_date + pd.Timedelta(days=period_days-1)]
-    total_prev_cases = df_prev_period["NU_CASOS"].sum()
+    total_prev_cases = cases.iloc[start_idx:split_idx].sum()
 
     # Current period: last `period_days` in the window
-    df_curr_period = df_window[df_window["DT_NOTIFIC"] > window_start_date + pd.Timedelta(days=period_days-1)]
-    total_curr_cases = df_curr_period["NU_CASOS"].sum()
+    total_curr_cases = cases.iloc[split_idx:].sum()
 
     # Calculate percentage change
     rate = (total_curr_cases - total_prev_cases) / total_prev_cases * 100
@@ -88,22 +97,21 @@ def calc_rate_by_period(
 
     Notes:
         - Only the last `period_days` from the latest date in the DataFrame are considered.
-        - Ensure 'DT_NOTIFIC' is datetime type.
+        - Ensure 'DT_NOTIFIC' is datetime type and sorted in ascending order.
         - This function is intended for descriptive reporting, not epidemiological modeling.
     """
 
-    # Identify the last date in the dataset
-    last_date = df_daily_info["DT_NOTIFIC"].max()
+    # Identify the last date in the dataset (dates are sorted)
+    dates = df_daily_info["DT_NOTIFIC"].to_numpy()
+    last_date = pd.Timestamp(dates[-1])
 
     # Define the start of the window for the period
     start_date = last_date - pd.Timedelta(days=period_days - 1)
+    start_idx = np.searchsorted(dates, start_date.to_datetime64())
 
-    # Filter DataFrame to only include rows in the period
-    df_period = df_daily_info[df_daily_info["DT_NOTIFIC"] >= start_date].copy()
-
-    # Sum numerator and denominator
-    numerator = df_period[numerator_col].sum()
-    denominator = df_period[denominator_col].sum()
+    # Sum numerator and denominator over the period (no intermediate frame)
+    numerator = df_daily_info[numerator_col].iloc[start_idx:].sum()
+    denominator = df_daily_info[denominator_col].iloc[start_idx:].sum()
 
     # Avoid division by zero
     if denominator == 0:
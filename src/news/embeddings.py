@@ -5,12 +5,25 @@ Provides a LangChain-compatible wrapper around the
 SentenceTransformers library for generating embeddings.
 """
 
-from typing import List
+import functools
+from typing import List, Optional
 
 from sentence_transformers import SentenceTransformer
 from langchain.embeddings.base import Embeddings
 
 
+@functools.lru_cache(maxsize=4)
+def _load_st(
+    model_name: str, device: Optional[str] = None
+) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer model once per (model_name, device) and
+    reuse it on later calls, avoiding repeated weight loading.
+    When `device` is None, SentenceTransformers picks CUDA if available.
+    """
+    return SentenceTransformer(model_name, device=device)
+
+
 class SentenceTransformerEmbeddings(Embeddings):
     """
     LangChain-compatible wrapper for SentenceTransformers models.
@@ -18,10 +31,15 @@ class SentenceTransformerEmbeddings(Embeddings):
     Args:
         model_name (str, optional): Name of the pre-trained model
             to use. Defaults to 'all-MiniLM-L6-v2'.
+        device (str, optional): Torch device ('cpu', 'cuda', ...).
+            Defaults to None (CUDA when available, otherwise CPU).
     """
 
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
-        self.model = SentenceTransformer(model_name)
+    def __init__(
+        self, model_name: str = 'all-MiniLM-L6-v2', device: Optional[str] = None
+    ):
+        self.model_name = model_name
+        self.model = _load_st(model_name, device)
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """
@@ -31,9 +49,18 @@ class SentenceTransformerEmbeddings(Embeddings):
             texts (List[str]): List of text documents.
 
         Returns:
-            List[List[float]]: Embeddings for each document.
+            List[List[float]]: L2-normalized embeddings for each document.
         """
-        return [self.model.encode(t) for t in texts]
+        # Encoding all texts in a single call lets SentenceTransformers
+        # batch tokenization and run one forward pass per batch
+        embeddings = self.model.encode(
+            texts,
+            batch_size=min(64, max(len(texts), 1)),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return [e.tolist() for e in embeddings]
 
     def embed_query(self, text: str) -> List[float]:
         """
@@ -43,6 +70,8 @@ class SentenceTransformerEmbeddings(Embeddings):
             text (str): The input query string.
 
         Returns:
-            List[float]: Embedding vector for the query.
+            List[float]: L2-normalized embedding vector for the query.
         """
-        return self.model.encode(text)
\ No newline at end of file
+        return self.model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        ).tolist()
\ No newline at end of file
@@ -4,17 +4,49 @@ Module: fetch_news
 Fetches news articles about SRAG from NewsAPI and returns a DataFrame.
 """
 
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
 from typing import Optional
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def fetch_news(API_KEY: str) -> Optional[pd.DataFrame]:
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3, 10)
+
+# Module-level session: keeps the TLS connection to NewsAPI pooled
+# and retries transient failures with exponential backoff
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    )
+)
+_session.headers.update({"Accept-Encoding": "gzip"})
+
+def fetch_news(
+        API_KEY: str, cache_dir: Optional[Path] = None
+    ) -> Optional[pd.DataFrame]:
 
     """
     Fetches recent news articles related to SRAG in Portuguese.
 
+    When `cache_dir` is given, the NewsAPI response is stored as JSON keyed
+    by the current hour and the query parameters, so runs within the same
+    hour reuse it instead of hitting the API again.
+
     Args:
         api_key (str): Your NewsAPI key.
+        cache_dir (Path, optional): Folder for cached responses.
+            Defaults to None (no caching).
 
     Returns:
         Optional[pd.DataFrame]: A DataFrame with columns
@@ -35,8 +67,27 @@ def fetch_news(API_KEY: str) -> Optional[pd.DataFrame]:
         "apiKey": API_KEY
     }
 
-    response = requests.get(url, params=params)
-    data = response.json()
+    # Cache key changes every hour, which works as a 1 hour TTL
+    cache_file = None
+    if cache_dir is not None:
+        cache_key = hashlib.sha1(
+            f"{datetime.now():%Y%m%d%H}-{query}-{language}-{page_size}".encode()
+        ).hexdigest()[:12]
+        cache_file = Path(cache_dir) / f"news_{cache_key}.json"
+
+    if cache_file is not None and cache_file.exists():
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    else:
+        try:
+            response = _session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            print("Erro na requisição:", e)
+            return None
+
+        if cache_file is not None and data.get("status") == "ok":
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(data), encoding="utf-8")
 
     if data.get("status") == "ok":
         articles = data.get("articles", [])
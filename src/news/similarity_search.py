@@ -1,19 +1,48 @@
+from typing import List, Union
+
+import numpy as np
+from langchain.schema import Document
 from langchain_community.vectorstores import FAISS
 
 def perform_similarity_search(
-        query: str, vectorstore: FAISS, k:int=2
+        queries: Union[str, List[str]], vectorstore: FAISS, k:int=2
     ):
     """
     Perform a similarity search on a FAISS vector store.
 
+    All queries are encoded in a single batch and searched with a single
+    FAISS call, so adding queries doesn't add transformer/index passes.
+
     Args:
-        query (str): The query string to search for.
+        queries (str | List[str]): The query string (or list of query strings) to search for.
         vectorstore (FAISS): A FAISS vector store object.
-        k (int, optional): Number of top similar results to return. Defaults to 2.
+        k (int, optional): Number of top similar results to return per query. Defaults to 2.
 
     Returns:
-        list: List of top-k documents most similar to the query.
+        list: List of top-k documents most similar to the query. When a list of
+              queries is given, one such list is returned per query.
     """
-    results = vectorstore.similarity_search(query, k)
-    return results
+    single_query = isinstance(queries, str)
+    if single_query:
+        queries = [queries]
+
+    query_embeddings = np.asarray(
+        vectorstore.embedding_function.embed_documents(queries), dtype="float32"
+    )
+    _, indices = vectorstore.index.search(query_embeddings, k)
+
+    # Map FAISS positions back to documents (-1 means fewer than k hits)
+    results = [
+        [
+            _get_document(vectorstore, int(i))
+            for i in query_indices if i != -1
+        ]
+        for query_indices in indices
+    ]
+
+    return results[0] if single_query else results
 
+def _get_document(vectorstore: FAISS, position: int) -> Document:
+    """Fetch the document stored at a given FAISS index position."""
+    docstore_id = vectorstore.index_to_docstore_id[position]
+    return vectorstore.docstore.search(docstore_id)
@@ -1,40 +1,129 @@
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import faiss
+import numpy as np
 import pandas as pd
 from langchain.schema import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from .embeddings import SentenceTransformerEmbeddings
 
-def generate_vector_store(df_news: pd.DataFrame):
+def generate_vector_store(
+        df_news: pd.DataFrame,
+        index_factory: Optional[str] = None,
+        cache_dir: Optional[Path] = None
+    ):
     """
     Generate a FAISS vector store from a DataFrame of news articles.
 
     Each document in the vector store contains the title and URL as content,
-    which is the only part that will be vectorized. Additional metadata 
-    (title, URL, publication date, source, description) is stored for 
+    which is the only part that will be vectorized. Additional metadata
+    (title, URL, publication date, source, description) is stored for
     reference but is not included in the embedding.
 
+    Embeddings are L2-normalized, so the index uses inner product, which
+    is equivalent to cosine similarity without the per-pair norm/sqrt work.
+    Vectors are stored quantized to float16, which is indistinguishable
+    from float32 for top-k retrieval over a few news articles.
+
     Args:
         df_news (pd.DataFrame): DataFrame containing news articles with columns:
             'title', 'url', 'publishedAt', 'source', 'description'.
+        index_factory (str, optional): FAISS factory string (e.g. "SQ8" or
+            "IVF64,PQ16") for larger corpora. The index is trained on the news
+            embeddings. Defaults to None, which builds a float16
+            `IndexScalarQuantizer`.
+        cache_dir (Path, optional): Folder where the built index is saved,
+            keyed by a hash of the embedding model and the news contents
+            (including metadata). If an index for the same model and news
+            already exists there, it is loaded instead of re-encoding.
+            Defaults to None (no caching).
 
     Returns:
         FAISS: A FAISS vector store object containing all news embeddings.
     """
 
-    documents = []
-    for _, row in df_news.iterrows():
-        # Only content will be vectorized
-        content = f"{row['title']} {row['url']}"
-        metadata = {
-            "title": row["title"],
-            "url": row["url"],
-            "publishedAt": row["publishedAt"],
-            "source": row["source"],
-            "description": row["description"]
-        }
-        documents.append(Document(page_content=content, metadata=metadata))
+    # Iterating over plain column values avoids building a Series per row
+    news_values = df_news[
+        ["title", "url", "publishedAt", "source", "description"]
+    ].to_numpy()
+
+    # Only content will be vectorized
+    documents = [
+        Document(
+            page_content=f"{title} {url}",
+            metadata={
+                "title": title,
+                "url": url,
+                "publishedAt": published_at,
+                "source": source,
+                "description": description
+            }
+        )
+        for title, url, published_at, source, description in news_values
+    ]
 
     embedding_wrapper = SentenceTransformerEmbeddings()
 
-    vectorstore = FAISS.from_documents(documents, embedding_wrapper)
+    # Reusing a previously built index for the same news corpus
+    cache_path = None
+    if cache_dir is not None:
+        # The key covers the embedding model (vector dimension) and every
+        # stored column, so a hit never returns mismatched vectors or metadata
+        cache_key = hashlib.sha1(
+            "\n".join(
+                [str(index_factory), embedding_wrapper.model_name]
+                + ["\t".join(map(str, row)) for row in news_values]
+            ).encode()
+        ).hexdigest()[:12]
+        cache_path = Path(cache_dir) / f"faiss_{cache_key}"
+
+        if (cache_path / "index.faiss").exists():
+            # Only files written by this function are loaded from this folder
+            return FAISS.load_local(
+                str(cache_path),
+                embedding_wrapper,
+                allow_dangerous_deserialization=True,
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+            )
+
+    embeddings = np.asarray(
+        embedding_wrapper.embed_documents(
+            [doc.page_content for doc in documents]
+        ),
+        dtype="float32"
+    )
+
+    # Building the index over normalized vectors (inner product = cosine)
+    dim = embeddings.shape[1]
+    # Vectors are stored as float16 by default, halving the index memory
+    if index_factory is None:
+        index = faiss.IndexScalarQuantizer(
+            dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+        )
+    else:
+        index = faiss.index_factory(dim, index_factory, faiss.METRIC_INNER_PRODUCT)
+    index.train(embeddings)
+    index.add(embeddings)
+
+    # Mapping FAISS positions to the documents stored in the docstore
+    index_to_docstore_id = {i: str(i) for i in range(len(documents))}
+    docstore = InMemoryDocstore(
+        {index_to_docstore_id[i]: doc for i, doc in enumerate(documents)}
+    )
+
+    vectorstore = FAISS(
+        embedding_function=embedding_wrapper,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+    )
+
+    if cache_path is not None:
+        vectorstore.save_local(str(cache_path))
 
-    return vectorstore
\ No newline at end of file
+    return vectorstore
@@ -20,6 +20,7 @@ Functions:
         COVID-19, or other/unspecified classifications.
 """
 
+import numpy as np
 import pandas as pd
 
 def generate_df_daily_info(
@@ -38,74 +39,62 @@ def generate_df_daily_info(
         df_srag (pd.DataFrame): Raw SRAG dataset containing at least
                                 the columns 'DT_NOTIFIC', 'NU_NOTIFIC',
                                 'EVOLUCAO', 'UTI', 'VACINA', 'VACINA_COV', 'CLASSI_FIN'.
+                                Rows should be sorted by 'DT_NOTIFIC' (as done
+                                when loading it); otherwise a sorted copy is made.
 
     Returns:
-        pd.DataFrame: Daily aggregated DataFrame 'df_daily_info'.
+        pd.DataFrame: Daily aggregated DataFrame 'df_daily_info', with one row
+                      per calendar day (sorted) and int32 count columns.
     """
-    
-    #Extracting daily quantity of cases
-    df_srag["NU_CASOS"] = (
-        df_srag.groupby("DT_NOTIFIC")["NU_NOTIFIC"]
-        .transform(lambda x: x.count())
-    )
-
-    # Generating initial df_daily_info
-    df_daily_info =(
-        df_srag[["DT_NOTIFIC", "NU_CASOS"]].drop_duplicates()
-        .reset_index(drop=True)
-    )
 
-    # Generating dataframe with daily deaths
-    df_deaths_daily = (
-        df_srag[df_srag["EVOLUCAO"] == 2]  
-        .groupby("DT_NOTIFIC")["EVOLUCAO"]  
-        .count()
-        .reset_index()
-        .rename(columns={"EVOLUCAO": "NU_OBITOS"})  
-    )
-
-    # Generating dataframe with daily UTI admission
-    df_utis_daily = (
-        df_srag[df_srag["UTI"] == 1]  
-        .groupby("DT_NOTIFIC")["UTI"]  
-        .count()
-        .reset_index()
-        .rename(columns={"UTI": "NU_UTI"})  
-    )
-
-    # Generating dataframe with daily vaccinations
+    # The date window filter relies on rows sorted by date (binary search),
+    # so unsorted input is sorted here instead of giving wrong counts
+    if not df_srag["DT_NOTIFIC"].is_monotonic_increasing:
+        df_srag = df_srag.sort_values("DT_NOTIFIC", kind="stable")
+    
+    # Labeling vaccination status
     # Given that the vaccination label is a bit more
-    # complex, to spare processing a filtered df_srag 
-    # needs to be considered
-    df_srag_filtered = filter_df_srag_for_vacc_label(
-        df_srag
-    )
-
+    # complex, to spare processing a filtered df_srag
+    # needs to be considered (cases outside of it count as 0)
     df_srag_filtered = label_vaccination_status(
-        df_srag_filtered
-    )
-    
-    df_vacinations_daily = (
-        df_srag_filtered[df_srag_filtered["VACINADO"] == 1]  
-        .groupby("DT_NOTIFIC")["VACINADO"]  
-        .count()
-        .reset_index()
-        .rename(columns={"VACINADO": "NU_VACINADOS"})  
+        filter_df_srag_for_vacc_label(df_srag)
     )
 
-    # Merging all dfs to df_daily_info 
-    df_daily_info = df_daily_info.merge(
-        df_deaths_daily, on="DT_NOTIFIC", how="left"
+    # The filtered frame is the positional tail of df_srag, so labels are
+    # assigned by position (works with any index, unique or not)
+    is_vacc = np.zeros(len(df_srag), dtype="int32")
+    is_vacc[len(df_srag) - len(df_srag_filtered):] = df_srag_filtered["VACINADO"].to_numpy()
+
+    # Building indicator columns so every daily count comes
+    # out of a single groupby pass (no merges needed)
+    df_indicators = df_srag[["DT_NOTIFIC", "NU_NOTIFIC"]].assign(
+        is_death=df_srag["EVOLUCAO"].eq(2).fillna(False).astype("int32"),
+        is_uti=df_srag["UTI"].eq(1).fillna(False).astype("int32"),
+        is_vacc=is_vacc
     )
 
-    df_daily_info = df_daily_info.merge(
-        df_utis_daily, on="DT_NOTIFIC", how="left"
+    df_daily_info = (
+        df_indicators
+        .groupby("DT_NOTIFIC", sort=True)
+        .agg(
+            NU_CASOS=("NU_NOTIFIC", "count"),
+            NU_OBITOS=("is_death", "sum"),
+            NU_UTI=("is_uti", "sum"),
+            NU_VACINADOS=("is_vacc", "sum")
+        )
     )
 
+    # Reindexing onto every calendar day: days without notifications
+    # get 0 counts and all columns keep a compact int32 dtype
+    full_date_range = pd.date_range(
+        df_daily_info.index.min(), df_daily_info.index.max(), freq="D"
+    )
     df_daily_info = (
-        df_daily_info.merge(
-            df_vacinations_daily, on="DT_NOTIFIC", how="left"
-        )
+        df_daily_info
+        .reindex(full_date_range, fill_value=0)
+        .astype("int32")
+        .rename_axis("DT_NOTIFIC")
+        .reset_index()
     )
 
     return df_daily_info
@@ -121,23 +110,28 @@ def filter_df_srag_for_vacc_label(
     When the periods will be user-editable, this function will have to be adapted. 
 
     Args:
-        df_srag (pd.DataFrame): Full SRAG dataset.
+        df_srag (pd.DataFrame): Full SRAG dataset, sorted by 'DT_NOTIFIC'.
 
     Returns:
-        pd.DataFrame: Filtered dataset containing only the last 30 days.
+        pd.DataFrame: Filtered dataset containing only the last 30 days and the
+                      columns 'DT_NOTIFIC', 'CLASSI_FIN', 'VACINA', 'VACINA_COV'.
     """
 
     max_period = 30 #Can be a variable if the solution evolves
 
-    current_max_date = df_srag["DT_NOTIFIC"].max()
+    # df_srag is sorted by date, so the window start is found by binary search
+    dates = df_srag["DT_NOTIFIC"].to_numpy()
+    current_max_date = pd.Timestamp(dates[-1])
 
     filter_start_date = (
         current_max_date - pd.Timedelta(days=max_period - 1)
     )
+    start_idx = np.searchsorted(dates, filter_start_date.to_datetime64())
 
-    df_srag_filtered = df_srag[
-        df_srag["DT_NOTIFIC"] >= filter_start_date
-    ].copy()
+    # Only the columns needed for labeling are taken from the slice
+    df_srag_filtered = df_srag.iloc[start_idx:][
+        ["DT_NOTIFIC", "CLASSI_FIN", "VACINA", "VACINA_COV"]
+    ]
 
     return df_srag_filtered
 
@@ -178,37 +172,16 @@ def label_vaccination_status(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     df = df.copy()
-    df["VACINADO"] = df.apply(classify_row, axis=1)
-
-    return df
-
-def classify_row(row):
-    classification = row["CLASSI_FIN"]
-    vacina = row["VACINA"]
-    vacina_covid = row["VACINA_COV"]
-
-    # Influenza
-    if classification == 1:
-        if vacina == 1:
-            return 1
-        else:
-            return 0
-
-    # COVID-19
-    elif classification == 5:
-        if vacina_covid == 1:
-            return 1
-        else:
-            return 0
 
-    # Other / Unspecified / Null
-    else:
-        if vacina == 1 and vacina_covid == 1:
-            return 1
-        else:
-            return 0
+    # Boolean masks evaluated column-wise (missing values count as "not 1")
+    is_influenza = (df["CLASSI_FIN"] == 1).to_numpy(dtype=bool, na_value=False)
+    is_covid = (df["CLASSI_FIN"] == 5).to_numpy(dtype=bool, na_value=False)
+    vacina = (df["VACINA"] == 1).to_numpy(dtype=bool, na_value=False)
+    vacina_covid = (df["VACINA_COV"] == 1).to_numpy(dtype=bool, na_value=False)
 
+    df["VACINADO"] = np.where(
+        is_influenza, vacina,
+        np.where(is_covid, vacina_covid, vacina & vacina_covid)
+    ).astype(np.int8)
 
-
-    
-    
\ No newline at end of file
+    return df
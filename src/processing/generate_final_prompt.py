@@ -6,11 +6,16 @@ def generate_final_prompt(
         last_date: datetime,
         chart_daily_period: int,
         chart_monthly_period: int
-    ) -> str:
+    ) -> tuple[str, str]:
 
     """
     Generate the final prompt for the AI agent to produce a SRAG report.
 
+    The prompt is split in two parts: a static system prompt (persona, report
+    layout and rules), which only depends on the chart periods and can be
+    cached by the LLM provider across runs, and a dynamic user prompt with
+    the current data and news.
+
     Args:
         metrics_prompt (str): Text describing the calculated metrics.
         top_news_content_list (List): List of LangChain Document objects representing top news.
@@ -19,7 +24,8 @@ def generate_final_prompt(
         chart_monthly_period (int): Number of months to reference in the monthly chart.
 
     Returns:
-        str: The final prompt string, ready to be sent to the AI model.
+        tuple[str, str]: The static system prompt and the dynamic user prompt,
+                         ready to be sent to the AI model.
     """
 
     news_prompt = build_news_prompt(top_news_content_list)
@@ -27,16 +33,10 @@ def generate_final_prompt(
     # Formatting datetime to a more coherent style “dd/mm/yyyy”
     last_date_str = last_date.strftime("%d/%m/%Y")
 
-    final_prompt = f"""
+    static_system_prompt = f"""
         Você é um analista de saúde pública especializado em surtos de Síndrome Respiratória Aguda Grave (SRAG).
         Com base nos dados e nas notícias fornecidas, produza um relatório técnico, bem estruturado e coerente.
 
-        Dados até {last_date_str}:
-        {metrics_prompt}
-
-        Notícias de apoio:
-        {news_prompt}
-
         Instruções para elaboração do relatório:
         1. Faça uma abertura contextual apresentando o cenário recente da SRAG.
         2. Comente cada métrica, destacando tendências (alta, queda ou estabilidade).
@@ -53,8 +53,16 @@ def generate_final_prompt(
         - Quando mencionar uma notícia pela primeira vez, inclua o URL de referência em (). 
 
         """
+
+    dynamic_user_prompt = f"""
+        Dados até {last_date_str}:
+        {metrics_prompt}
+
+        Notícias de apoio:
+        {news_prompt}
+        """
     
-    return final_prompt
+    return static_system_prompt, dynamic_user_prompt
 
 def build_news_prompt(top_news_content_list: list) -> str:
     """
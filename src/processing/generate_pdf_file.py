@@ -1,19 +1,44 @@
 # Standard library imports
+import io
 import os
 import platform
 import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import AsyncIterable, Iterable, Iterator, Optional
 
 # Third-party imports
+import numpy as np
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Image, Spacer
+from reportlab.platypus import (
+    BaseDocTemplate, Flowable, Frame, Image, PageTemplate, Paragraph, Spacer
+)
+
+# Matches <a href="url">text</a>, compiled once for all paragraphs
+_HREF_RE = re.compile(r'<a href="([^"]+)">([^<]+)</a>')
+
+# Escapes the characters Paragraph would parse as markup (applied in C by str.translate)
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Paragraph separator (any run of blank lines), scanned lazily instead of
+# splitting the whole text
+_PARA_SEP_RE = re.compile(r"\n{2,}")
+
+# Report stylesheet, built once at import ('TitleStyle' and 'Justify' added).
+# Paragraphs only read their style, so it is shared across reports
+_BASE_STYLES = getSampleStyleSheet()
+_BASE_STYLES.add(ParagraphStyle(name="TitleStyle", fontSize=18, leading=22, spaceAfter=1*cm))
+_BASE_STYLES.add(ParagraphStyle(name="Justify", parent=_BASE_STYLES["Normal"], alignment=4))  # justify
 
 
 def build_pdf_report(
         output_path: Path, IMAGES_DIR: Path, 
-        report_text: str, title: str = "Generated Report"
+        report_text: str, title: str = "Generated Report",
+        image_buffers: Optional[list[io.BytesIO]] = None
     ):
     """
     Build a professional PDF report with title, text (justified), images on the same page, 
@@ -27,76 +52,242 @@ def build_pdf_report(
     report_text (str): The textual content of the report.
     title (str, optional): Title to display at the top of the PDF report. 
                             Defaults to "Generated Report".
+    image_buffers (list[io.BytesIO], optional): In-memory PNG images to include instead
+                            of reading them from `IMAGES_DIR`. Defaults to None.
+    """
+
+    styles = _BASE_STYLES
+
+    text_flowables = iter_text_flowables(iter_paragraphs(report_text), styles)
+
+    write_pdf_report(
+        output_path, IMAGES_DIR, text_flowables, title, styles, image_buffers
+    )
+
+
+async def build_pdf_report_from_stream(
+        output_path: Path, IMAGES_DIR: Path,
+        report_chunks: AsyncIterable[str], title: str = "Generated Report",
+        image_buffers: Optional[list[io.BytesIO]] = None
+    ) -> str:
+    """
+    Same as `build_pdf_report`, but consuming the report text while it is
+    streamed (e.g. by the LLM). Each paragraph is turned into flowables as
+    soon as it is complete, so text parsing overlaps with text generation.
+
+    Args:
+    output_path (Path): Folder where the final PDF report will be saved. 
+                        The folder will be created if it does not exist.
+    IMAGES_DIR (Path): Folder containing the PNG images to include in the report.
+    report_chunks (AsyncIterable[str]): Chunks of the report text, in order.
+    title (str, optional): Title to display at the top of the PDF report. 
+                            Defaults to "Generated Report".
+    image_buffers (list[io.BytesIO], optional): In-memory PNG images to include instead
+                            of reading them from `IMAGES_DIR`. Defaults to None.
+
+    Returns:
+        str: The full report text.
+    """
+
+    styles = _BASE_STYLES
+
+    chunks = []
+    text_flowables = []
+
+    # Rolling buffer holding only the paragraph still being received
+    buffer = ""
+    async for chunk in report_chunks:
+        chunks.append(chunk)
+        buffer += chunk
+        *paragraphs, buffer = _PARA_SEP_RE.split(buffer)
+        text_flowables.extend(iter_text_flowables(paragraphs, styles))
+    text_flowables.extend(iter_text_flowables([buffer], styles))
+
+    write_pdf_report(
+        output_path, IMAGES_DIR, text_flowables, title, styles, image_buffers
+    )
+
+    return "".join(chunks)
+
+
+def write_pdf_report(
+        output_path: Path, IMAGES_DIR: Path,
+        text_flowables: Iterable[Flowable], title: str, styles,
+        image_buffers: Optional[list[io.BytesIO]] = None
+    ):
+    """
+    Lay out and save the PDF report (title, text flowables and images),
+    then open it automatically.
+
+    Args:
+    output_path (Path): Folder where the final PDF report will be saved. 
+                        The folder will be created if it does not exist.
+    IMAGES_DIR (Path): Folder containing the PNG images to include in the report.
+    text_flowables (Iterable[Flowable]): Flowables of the report text.
+    title (str): Title to display at the top of the PDF report.
+    styles: ReportLab stylesheet containing the 'TitleStyle' and 'Justify' styles.
+    image_buffers (list[io.BytesIO], optional): In-memory PNG images to include instead
+                            of reading them from `IMAGES_DIR`. Defaults to None.
     """
     
     # Ensure output folder exists
     output_path.mkdir(parents=True, exist_ok=True)
     output_file = output_path / "final_report.pdf"
 
-    # Setup the document
-    doc = SimpleDocTemplate(
+    # Setup the document: a single frame inside the margins, numbering every page.
+    # Page streams are always Flate-compressed (not left to the rl_config default)
+    doc = BaseDocTemplate(
         str(output_file),
         pagesize=A4,
         rightMargin=2*cm, leftMargin=2*cm,
-        topMargin=2*cm, bottomMargin=2*cm
+        topMargin=2*cm, bottomMargin=2*cm,
+        pageCompression=1
     )
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="normal")
+    doc.addPageTemplates(
+        [PageTemplate(id="report", frames=[frame], onPage=add_page_number)]
+    )
+
+    # Build PDF with page numbers. Flowables are produced lazily and only
+    # materialized here, since platypus consumes them from a list while
+    # laying out pages
+    doc.build(
+        list(iter_report_flowables(
+            IMAGES_DIR, text_flowables, title, styles, image_buffers
+        ))
+    )
+
+    # Open PDF automatically (non-blocking, argv list so no shell is involved).
+    # Without a PDF opener (e.g. headless Linux) only the path is shown
+    pdf_path_str = str(output_file)
+    try:
+        if platform.system() == "Darwin":       # macOS
+            subprocess.Popen(
+                ["open", pdf_path_str],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        elif platform.system() == "Windows":    # Windows
+            os.startfile(pdf_path_str)
+        else:                                   # Linux variants
+            subprocess.Popen(
+                ["xdg-open", pdf_path_str],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+    except OSError:
+        print(f"Não foi possível abrir o PDF automaticamente. Arquivo salvo em: {pdf_path_str}")
+
 
-    # Styles
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="TitleStyle", fontSize=18, leading=22, spaceAfter=1*cm))
-    styles.add(ParagraphStyle(name="Justify", parent=styles["Normal"], alignment=4))  # justify
+def iter_report_flowables(
+        IMAGES_DIR: Path, text_flowables: Iterable[Flowable], title: str, styles,
+        image_buffers: Optional[list[io.BytesIO]] = None
+    ) -> Iterator[Flowable]:
+    """
+    Yield the report flowables in order: title, text flowables and the PNG
+    images (`image_buffers`, or the files in `IMAGES_DIR` when not given),
+    all scaled to fit on a single page.
 
-    story = []
+    Args:
+    IMAGES_DIR (Path): Folder containing the PNG images to include in the report.
+    text_flowables (Iterable[Flowable]): Flowables of the report text.
+    title (str): Title to display at the top of the PDF report.
+    styles: ReportLab stylesheet containing the 'TitleStyle' and 'Justify' styles.
+    image_buffers (list[io.BytesIO], optional): In-memory PNG images to include instead
+                            of reading them from `IMAGES_DIR`. Defaults to None.
+    """
 
     # Add title page
-    story.append(Paragraph(title, styles["TitleStyle"]))
-    story.append(Spacer(1, 1*cm))
+    yield Paragraph(title, styles["TitleStyle"])
+    yield Spacer(1, 1*cm)
 
-    # Add report text (justified), removing <a href> markup and leaving plain links
-    for paragraph in report_text.split("\n\n"):
-        # Regex para substituir <a href="url">texto</a> por "texto (url)"
-        clean_paragraph = re.sub(
-            r'<a href="([^"]+)">([^<]+)</a>',
-            r'\2 (\1)',
-            paragraph
-        )
-        story.append(Paragraph(clean_paragraph, styles["Justify"]))
-        story.append(Spacer(1, 0.5*cm))
-
-    # Get image paths
-    image_paths = sorted(IMAGES_DIR.glob("*.png"))  # optional: order by name
-    image_paths = [str(p) for p in image_paths]
+    # Add report text
+    yield from text_flowables
+
+    # Get image sources: in-memory PNGs if given, else the folder's files
+    # (scandir entries expose names without extra stat calls)
+    image_paths = []
+    if image_buffers is not None:
+        image_paths = image_buffers
+    elif IMAGES_DIR.is_dir():
+        with os.scandir(IMAGES_DIR) as entries:
+            image_paths = sorted(  # optional: order by name
+                entry.path for entry in entries if entry.name.endswith(".png")
+            )
 
     # Page constraints
     max_width = A4[0] - 4*cm
     max_height = (A4[1] - 6*cm) / len(image_paths) if image_paths else 0  # divide height among images
 
+    # Probe all image sizes concurrently (PIL only reads the PNG header)
+    sizes = []
+    if image_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(image_paths))) as executor:
+            sizes = list(executor.map(probe_image_size, image_paths))
+
+    # Maintain aspect ratio, computing every image size at once, then create
+    # each image already at its final size
+    images = []
+    if sizes:
+        widths, heights = np.array(sizes, dtype=float).T
+        ratios = widths / heights
+
+        draw_widths = np.minimum(widths, max_width)
+        draw_heights = draw_widths / ratios
+
+        too_tall = draw_heights > max_height
+        draw_heights[too_tall] = max_height
+        draw_widths[too_tall] = max_height * ratios[too_tall]
+
+        images = [
+            Image(source, width=float(draw_width), height=float(draw_height))
+            for source, draw_width, draw_height
+            in zip(image_paths, draw_widths, draw_heights)
+        ]
+
     # Add all images on the same page
-    for img_path in image_paths:
-        img = Image(img_path)
+    for img in images:
+        yield img
+        yield Spacer(1, 0.5*cm)
 
-        # Maintain aspect ratio
-        img_ratio = img.imageWidth / img.imageHeight
-        img.drawWidth = min(img.imageWidth, max_width)
-        img.drawHeight = img.drawWidth / img_ratio
-        if img.drawHeight > max_height:
-            img.drawHeight = max_height
-            img.drawWidth = max_height * img_ratio
 
-        story.append(img)
-        story.append(Spacer(1, 0.5*cm))
+def probe_image_size(source) -> tuple[int, int]:
+    """
+    Return the (width, height) in pixels of an image file path or
+    in-memory buffer, read from its header with PIL. Buffers are rewound
+    so ReportLab can read them afterwards.
+    """
+    with PILImage.open(source) as img:
+        size = img.size
 
-    # Build PDF with page numbers
-    doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
+    if hasattr(source, "seek"):
+        source.seek(0)
 
-    # Open PDF automatically
-    pdf_path_str = str(output_file)
-    if platform.system() == "Darwin":       # macOS
-        os.system(f"open '{pdf_path_str}'")
-    elif platform.system() == "Windows":    # Windows
-        os.startfile(pdf_path_str)
-    else:                                   # Linux variants
-        os.system(f"xdg-open '{pdf_path_str}'")
+    return size
+
+
+def iter_text_flowables(
+        paragraphs: Iterable[str], styles
+    ) -> Iterator[Flowable]:
+    """
+    Yield a justified Paragraph (plus spacing) for each paragraph of text,
+    removing <a href> markup and leaving plain links. The remaining text is
+    XML-escaped, so stray '&', '<' or '>' are rendered literally instead of
+    being parsed as markup. Empty or whitespace-only paragraphs are skipped.
+    """
+    for paragraph in filter(None, map(str.strip, paragraphs)):
+        # Regex para substituir <a href="url">texto</a> por "texto (url)"
+        clean_paragraph = _HREF_RE.sub(r'\2 (\1)', paragraph)
+        clean_paragraph = clean_paragraph.translate(_XML_ESC)
+        yield Paragraph(clean_paragraph, styles["Justify"])
+        yield Spacer(1, 0.5*cm)
+
+
+def iter_paragraphs(text: str) -> Iterator[str]:
+    """Yield the paragraphs of `text` separated by blank lines, one at a time."""
+    start = 0
+    for match in _PARA_SEP_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
 
 
 def add_page_number(canvas, doc):
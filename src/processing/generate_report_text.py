@@ -1,25 +1,184 @@
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Tuple
+
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_anthropic import ChatAnthropic
+from langchain_core.runnables import Runnable
+
+# LRU cache of report chains per LLM instance (see `_chain_for`)
+_CHAIN_CACHE_SIZE = 4
+_chain_cache: "OrderedDict[int, tuple[ChatAnthropic, Runnable]]" = OrderedDict()
 
-def generate_final_report(
-    final_prompt: str,
-    llm: ChatAnthropic
+async def generate_final_report(
+    static_system_prompt: str,
+    dynamic_user_prompt: str,
+    llm: ChatAnthropic,
+    cache_dir: Optional[Path] = None,
+    cache_enabled: bool = True
 ) -> str:
     """
-    Generate the final SRAG report using a provided string prompt
-    and an Anthropic LLM.
+    Generate the final SRAG report using the provided prompts
+    and an Anthropic LLM, collecting the streamed response
+    (see `stream_final_report`).
 
     Args:
-        final_prompt (str): The fully formatted prompt containing metrics,
-                            news, and instructions for the report.
+        static_system_prompt (str): Fixed report instructions (persona,
+                                    layout and rules).
+        dynamic_user_prompt (str): Prompt with the current metrics and news.
         llm (ChatAnthropic): Initialized Anthropic chat LLM instance.
+        cache_dir (Path, optional): Folder for cached reports.
+                                    Defaults to None (no caching).
+        cache_enabled (bool, optional): Set to False to bypass the cache
+                                        (e.g. in tests). Defaults to True.
 
     Returns:
         str: The generated report text from the LLM.
     """
 
-    # Build the chain
-    generate_report_chain = llm | StrOutputParser()
+    chunks = []
+    async for chunk in stream_final_report(
+        static_system_prompt, dynamic_user_prompt, llm,
+        cache_dir=cache_dir, cache_enabled=cache_enabled
+    ):
+        chunks.append(chunk)
+
+    return "".join(chunks)
+
+
+async def stream_final_report(
+    static_system_prompt: str,
+    dynamic_user_prompt: str,
+    llm: ChatAnthropic,
+    cache_dir: Optional[Path] = None,
+    cache_enabled: bool = True
+) -> AsyncIterator[str]:
+    """
+    Stream the final SRAG report text from an Anthropic LLM, yielding
+    chunks as soon as they are produced, so downstream steps (e.g. the
+    PDF builder) can start working before the response is complete.
+
+    The static system prompt is marked with Anthropic's `cache_control`,
+    so repeated runs can reuse it from the prompt cache.
+
+    When `cache_dir` is given and the LLM is deterministic (temperature 0),
+    the report text is also stored on disk keyed by a SHA-256 of the model
+    and prompts, so identical runs skip the LLM call entirely (the cached
+    text is yielded as a single chunk).
+
+    Args:
+        static_system_prompt (str): Fixed report instructions (persona,
+                                    layout and rules).
+        dynamic_user_prompt (str): Prompt with the current metrics and news.
+        llm (ChatAnthropic): Initialized Anthropic chat LLM instance.
+        cache_dir (Path, optional): Folder for cached reports.
+                                    Defaults to None (no caching).
+        cache_enabled (bool, optional): Set to False to bypass the cache
+                                        (e.g. in tests). Defaults to True.
+
+    Yields:
+        str: Consecutive chunks of the generated report text.
+    """
+
+    # Only deterministic outputs are worth caching
+    cache_file = None
+    if cache_enabled and cache_dir is not None and llm.temperature == 0:
+        cache_key = hashlib.sha256(
+            "\n".join(
+                [llm.model, static_system_prompt, dynamic_user_prompt]
+            ).encode()
+        ).hexdigest()
+        cache_file = Path(cache_dir) / f"report_{cache_key}.txt"
+
+        if cache_file.exists():
+            yield cache_file.read_text(encoding="utf-8")
+            return
+
+    messages = build_report_messages(static_system_prompt, dynamic_user_prompt)
+
+    generate_report_chain = _chain_for(llm)
+
+    # Stream the chain with the messages, passing chunks along as they arrive
+    chunks = []
+    async for chunk in generate_report_chain.astream(messages):
+        chunks.append(chunk)
+        yield chunk
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text("".join(chunks), encoding="utf-8")
+
+
+async def generate_final_reports_batch(
+    prompts: List[Tuple[str, str]],
+    llm: ChatAnthropic,
+    max_concurrency: int = 5
+) -> List[str]:
+    """
+    Generate several SRAG reports concurrently (e.g. per region or period).
 
-    # Invoke the chain with the final_prompt string
-    return generate_report_chain.invoke(final_prompt)
+    Requests run in parallel, up to `max_concurrency` at a time, so the
+    total time is close to the slowest report instead of the sum of all.
+
+    Args:
+        prompts (List[Tuple[str, str]]): (static_system_prompt, dynamic_user_prompt)
+                                         pairs, one per report.
+        llm (ChatAnthropic): Initialized Anthropic chat LLM instance.
+        max_concurrency (int, optional): Maximum number of simultaneous
+                                         requests. Defaults to 5.
+
+    Returns:
+        List[str]: The generated report texts, in the same order as `prompts`.
+    """
+
+    generate_report_chain = _chain_for(llm)
+
+    return await generate_report_chain.abatch(
+        [build_report_messages(static, dynamic) for static, dynamic in prompts],
+        config={"max_concurrency": max_concurrency}
+    )
+
+
+def _chain_for(llm: ChatAnthropic) -> Runnable:
+    """
+    Return the `llm | StrOutputParser()` chain for `llm`, built once per
+    LLM instance and reused by later calls.
+
+    LangChain chat models are not hashable, so entries are keyed by object
+    identity and keep a reference to the LLM (its id can't be reused while
+    it is cached).
+    """
+    key = id(llm)
+
+    if key in _chain_cache and _chain_cache[key][0] is llm:
+        _chain_cache.move_to_end(key)
+        return _chain_cache[key][1]
+
+    chain = llm | StrOutputParser()
+
+    _chain_cache[key] = (llm, chain)
+    if len(_chain_cache) > _CHAIN_CACHE_SIZE:
+        _chain_cache.popitem(last=False)
+
+    return chain
+
+
+def build_report_messages(
+    static_system_prompt: str, dynamic_user_prompt: str
+) -> list:
+    """
+    Build the chat messages for a report, marking the static system prompt
+    with Anthropic's `cache_control` so it can be served from the prompt cache.
+    """
+    return [
+        SystemMessage(content=[
+            {
+                "type": "text",
+                "text": static_system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]),
+        HumanMessage(content=dynamic_user_prompt)
+    ]
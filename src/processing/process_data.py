@@ -1,3 +1,7 @@
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd 
 
 from src.preprocessing.generate_aux_df import generate_df_daily_info
@@ -6,6 +10,40 @@ from src.metrics.calc_metrics import (
 )
 from src.charts.create_charts import generate_and_store_plots
 
+# LRU cache of daily info per SRAG DataFrame (generate_df_daily_info is pure)
+_DAILY_INFO_CACHE_SIZE = 4
+_daily_info_cache: "OrderedDict[int, tuple[pd.DataFrame, pd.DataFrame]]" = OrderedDict()
+
+def get_df_daily_info(df_srag: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return `generate_df_daily_info(df_srag)`, reusing the result of previous
+    calls with the same DataFrame object.
+
+    Entries are keyed by object identity and keep a reference to the frame,
+    so its id can't be reused by another frame while it is cached (the
+    identity is checked on lookup). In-place edits of a cached frame's
+    values are not detected.
+
+    Args:
+        df_srag (pd.DataFrame): Raw SRAG dataset, ideally sorted by 'DT_NOTIFIC' (see `generate_df_daily_info`).
+
+    Returns:
+        pd.DataFrame: Daily aggregated DataFrame (shared, treat as read-only).
+    """
+    key = id(df_srag)
+
+    if key in _daily_info_cache and _daily_info_cache[key][0] is df_srag:
+        _daily_info_cache.move_to_end(key)
+        return _daily_info_cache[key][1]
+
+    df_daily_info = generate_df_daily_info(df_srag)
+
+    _daily_info_cache[key] = (df_srag, df_daily_info)
+    if len(_daily_info_cache) > _DAILY_INFO_CACHE_SIZE:
+        _daily_info_cache.popitem(last=False)
+
+    return df_daily_info
+
 def generate_metrics_prompt_and_plots(
     qty_of_cases_var_period_1: int, 
     qty_of_cases_var_period_2: int, 
@@ -13,7 +51,7 @@ def generate_metrics_prompt_and_plots(
     uti_occup_rate_period: int,
     vacc_rate_period: int,
     df_srag: pd.DataFrame
-) -> str:
+) -> tuple[str, list[io.BytesIO]]:
     """
     Generate a summary of SRAG metrics as a string prompt and create/store corresponding plots.
 
@@ -23,37 +61,55 @@ def generate_metrics_prompt_and_plots(
         death_rate_period (int): Number of days to calculate the mortality rate.
         uti_occup_rate_period (int): Number of days to calculate ICU occupancy rate.
         vacc_rate_period (int): Number of days to calculate vaccination rate.
-        df_srag (pd.DataFrame): Raw SRAG dataset.
+        df_srag (pd.DataFrame): Raw SRAG dataset, ideally sorted by 'DT_NOTIFIC' (see `generate_df_daily_info`).
 
     Returns:
-        str: Metrics summary formatted as a string to be used in the final report prompt.
+        tuple[str, list[io.BytesIO]]: Metrics summary formatted as a string to be used
+            in the final report prompt, and the PNG buffers of the stored plots.
     """
     # Generate auxiliary DataFrame with daily information
-    df_daily_info = generate_df_daily_info(df_srag)
-
-    # Calculate metrics in % 
-    case_var_period_1 = calc_case_var_rate_by_period(
-        df_daily_info, qty_of_cases_var_period_1
-    )
-
-    case_var_period_2 = calc_case_var_rate_by_period(
-        df_daily_info, qty_of_cases_var_period_2
-    )
-
-    death_rate = calc_rate_by_period(
-        df_daily_info, "NU_OBITOS", "NU_CASOS",
-        death_rate_period
-    )
-
-    uti_occup_rate = calc_rate_by_period(
-        df_daily_info, "NU_UTI", "NU_CASOS",
-        uti_occup_rate_period
-    )
-
-    vacc_rate = calc_rate_by_period(
-        df_daily_info, "NU_VACINADOS", "NU_CASOS",
-        vacc_rate_period
-    )
+    df_daily_info = get_df_daily_info(df_srag)
+
+    # Calculate metrics in % and generate/store plots concurrently.
+    # All tasks only read df_daily_info, which is shared between threads
+    tasks = {
+        "case_var_period_1": (
+            calc_case_var_rate_by_period,
+            (df_daily_info, qty_of_cases_var_period_1)
+        ),
+        "case_var_period_2": (
+            calc_case_var_rate_by_period,
+            (df_daily_info, qty_of_cases_var_period_2)
+        ),
+        "death_rate": (
+            calc_rate_by_period,
+            (df_daily_info, "NU_OBITOS", "NU_CASOS", death_rate_period)
+        ),
+        "uti_occup_rate": (
+            calc_rate_by_period,
+            (df_daily_info, "NU_UTI", "NU_CASOS", uti_occup_rate_period)
+        ),
+        "vacc_rate": (
+            calc_rate_by_period,
+            (df_daily_info, "NU_VACINADOS", "NU_CASOS", vacc_rate_period)
+        ),
+        "plots": (generate_and_store_plots, (df_daily_info,))
+    }
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            name: executor.submit(fn, *args) for name, (fn, args) in tasks.items()
+        }
+        results = {name: future.result() for name, future in futures.items()}
+
+    # Rates are rounded once, as plain floats, so the prompt carries compact
+    # numbers (fewer tokens) whatever the precision/type the metrics return
+    case_var_period_1 = round_metric(results["case_var_period_1"])
+    case_var_period_2 = round_metric(results["case_var_period_2"])
+    death_rate = round_metric(results["death_rate"])
+    uti_occup_rate = round_metric(results["uti_occup_rate"])
+    vacc_rate = round_metric(results["vacc_rate"])
+    chart_buffers = results["plots"]
 
     # Storing metrics on a string to serve as a prompt later 
     # This will facilitate the construction of the final prompt
@@ -66,17 +122,14 @@ def generate_metrics_prompt_and_plots(
         f"- Taxa de mortalidade nos últimos {death_rate_period} dias: {death_rate}%\n"
     )
 
-    # Generate and store plots
-    generate_and_store_plots(df_daily_info)
-
     return (
-        metrics_prompt
+        metrics_prompt, chart_buffers
     )
 
 
+def round_metric(value, ndigits: int = 2):
+    """Round a metric to `ndigits` decimals as a plain float, keeping `None` (undefined rate)."""
+    if value is None:
+        return None
 
-
-
-
-    
-    
+    return round(float(value), ndigits)